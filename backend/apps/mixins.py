@@ -0,0 +1,43 @@
+"""
+Mixins shared across apps.
+"""
+from copy import copy
+
+
+def _class_cache(cls, attr, build):
+    """
+    Return `attr` from the class' own __dict__, building and storing it on
+    first use. Reading the class __dict__ rather than getattr keeps
+    subclasses from sharing their parent's cache.
+    """
+    cached = cls.__dict__.get(attr)
+    if cached is None:
+        cached = build()
+        setattr(cls, attr, cached)
+    return cached
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer's fields once per class and hand each instance
+    shallow copies instead of rebuilding them on every instantiation.
+    """
+    def get_fields(self):
+        """
+        Return copies of the class-level field cache, filling it on first use.
+        """
+        cached_fields = _class_cache(self.__class__, '_fields_cache', super().get_fields)
+        return {name: copy(field) for name, field in cached_fields.items()}
+
+
+class CachedPermissionsMixin:
+    """
+    Instantiate a view's permission classes once per view class and reuse
+    them on every request, instead of constructing them on each dispatch.
+    Only use with permissions that keep no per-request state.
+    """
+    def get_permissions(self):
+        """
+        Return the class-level permission instances, creating them on first use.
+        """
+        return _class_cache(self.__class__, '_permissions_cache', super().get_permissions)
@@ -0,0 +1,15 @@
+"""
+Pagination classes shared across apps.
+"""
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Keyset pagination on the newest first, so deep pages don't pay for a
+    growing OFFSET.
+    """
+    ordering = '-created_at'
+    page_size = 10
+    page_size_query_param = 'pagesize'
+    max_page_size = 100
@@ -0,0 +1,46 @@
+"""
+Caching helpers for the published posts listing.
+"""
+from django.core.cache import cache
+
+PUBLISHED_CACHE_TIMEOUT = 60
+PUBLISHED_VERSION_KEY = 'posts:published:version'
+
+
+def _page_key(url):
+    """
+    Return the cache key for a published posts page.
+    """
+    return f'posts:published:page:{url}'
+
+
+def get_published_page(url):
+    """
+    Return the current published posts version and the cached page for
+    `url`, reading both in one round trip. The page is None when it is
+    missing or was built under an older version.
+    """
+    page_key = _page_key(url)
+    cached = cache.get_many([PUBLISHED_VERSION_KEY, page_key])
+    version = cached.get(PUBLISHED_VERSION_KEY, 0)
+    entry = cached.get(page_key)
+    if entry is None or entry[0] != version:
+        return version, None
+    return version, entry[1]
+
+
+def set_published_page(url, version, data):
+    """
+    Cache a published posts page, tagged with the version it was built under.
+    """
+    cache.set(_page_key(url), (version, data), PUBLISHED_CACHE_TIMEOUT)
+
+
+def invalidate_published_cache():
+    """
+    Bump the published posts version so cached pages are no longer used.
+    """
+    try:
+        cache.incr(PUBLISHED_VERSION_KEY)
+    except ValueError:
+        cache.set(PUBLISHED_VERSION_KEY, 1, None)
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.7 on 2026-10-15 14:48
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('posts', '0001_initial'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='post',
+            index=models.Index(fields=['author', '-created_at'], name='post_author_created_at_idx'),
+        ),
+        AddIndexConcurrently(
+            model_name='post',
+            index=models.Index(fields=['is_published'], name='post_is_published_idx'),
+        ),
+    ]
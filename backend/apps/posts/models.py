@@ -1,5 +1,7 @@
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models.functions import Upper
 
 
 class Post(models.Model):
@@ -21,6 +23,13 @@ class Post(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Post'
         verbose_name_plural = 'Posts'
+        indexes = [
+            models.Index(fields=['author', '-created_at'], name='post_author_created_at_idx'),
+            models.Index(fields=['is_published'], name='post_is_published_idx'),
+            # SearchFilter emits UPPER(col) LIKE UPPER('%term%'), which these trigram indexes serve
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='post_title_trgm'),
+            GinIndex(OpClass(Upper('content'), name='gin_trgm_ops'), name='post_content_trgm'),
+        ]
 
     def __str__(self):
         return self.title
@@ -1,12 +1,13 @@
 from rest_framework import serializers
+from apps.mixins import CachedFieldsMixin
 from .models import Post
 
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for Post model with all CRUD operations.
     """
-    author_username = serializers.ReadOnlyField(source='author.username')
+    author_username = serializers.ReadOnlyField(source='author.get_full_name')
 
     class Meta:
         model = Post
@@ -20,7 +21,7 @@ class PostSerializer(serializers.ModelSerializer):
             'updated_at',
             'is_published'
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at', 'author_username']
+        read_only_fields = ['id', 'author', 'created_at', 'updated_at', 'author_username']
 
     def create(self, validated_data):
         """
@@ -30,11 +31,11 @@ class PostSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
-class PostListSerializer(serializers.ModelSerializer):
+class PostListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     Lightweight serializer for listing posts.
     """
-    author_username = serializers.ReadOnlyField(source='author.username')
+    author_username = serializers.ReadOnlyField(source='author.get_full_name')
 
     class Meta:
         model = Post
@@ -0,0 +1,17 @@
+"""
+Signal handlers for the posts app.
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .cache import invalidate_published_cache
+from .models import Post
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_published_posts(sender, **kwargs):
+    """
+    Drop cached published posts whenever a post is saved or deleted.
+    """
+    invalidate_published_cache()
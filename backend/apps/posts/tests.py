@@ -1,3 +1,147 @@
+"""
+Tests for Post endpoints.
+"""
+from django.core.cache import cache
 from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
 
-# Create your tests here.
+from .models import Post
+from .serializers import PostSerializer, PostListSerializer
+
+User = get_user_model()
+
+
+class PostQueryTests(TestCase):
+    """Test the number of queries issued by post endpoints"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.posts_url = '/api/posts/'
+        for i in range(3):
+            author = User.objects.create_user(
+                email=f'author{i}@example.com',
+                password='TestPass123!',
+                first_name='Author',
+                last_name=str(i)
+            )
+            Post.objects.create(
+                title=f'Post {i}',
+                content='Content',
+                author=author,
+                is_published=True
+            )
+
+    def test_list_posts_query_count(self):
+        """Test listing posts does not query the author once per post"""
+        # A single SELECT joined with the author, no COUNT for cursor pagination
+        with self.assertNumQueries(1):
+            res = self.client.get(self.posts_url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data['results']), 3)
+
+    def test_posts_render_author_username(self):
+        """Test list and detail payloads name the author without exposing the email"""
+        post = Post.objects.get(title='Post 0')
+
+        res = self.client.get(self.posts_url)
+
+        self.assertIn('Author 0', [item['author_username'] for item in res.data['results']])
+        self.assertNotIn('author0@example.com', res.content.decode())
+
+        res = self.client.get(f'{self.posts_url}{post.id}/')
+
+        self.assertEqual(res.data['author_username'], 'Author 0')
+        self.assertNotIn('author0@example.com', res.content.decode())
+
+    def test_list_posts_defers_content(self):
+        """Test listing posts does not load the post content"""
+        with self.assertNumQueries(1) as ctx:
+            self.client.get(self.posts_url)
+
+        self.assertNotIn('"content"', ctx.captured_queries[-1]['sql'])
+
+    def test_published_posts_skip_author_row(self):
+        """Test post actions do not load unused author columns"""
+        with self.assertNumQueries(1) as ctx:
+            self.client.get(f'{self.posts_url}published/')
+
+        self.assertNotIn('"password"', ctx.captured_queries[-1]['sql'])
+
+    def test_update_post_by_author(self):
+        """Test the author can update a post loaded with deferred columns"""
+        post = Post.objects.get(title='Post 0')
+        self.client.force_authenticate(user=post.author)
+
+        res = self.client.patch(f'{self.posts_url}{post.id}/', {'title': 'Updated'}, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        post.refresh_from_db()
+        self.assertEqual(post.title, 'Updated')
+        self.assertEqual(post.content, 'Content')
+
+    def test_create_post_sets_author(self):
+        """Test creating a post assigns the current user as author"""
+        author = User.objects.get(email='author0@example.com')
+        self.client.force_authenticate(user=author)
+        payload = {'title': 'New post', 'content': 'Content'}
+
+        res = self.client.post(self.posts_url, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Post.objects.get(title='New post').author, author)
+
+    def test_published_posts_paginated(self):
+        """Test the published action returns a single page of posts"""
+        res = self.client.get(f'{self.posts_url}published/', {'pagesize': 2})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data['results']), 2)
+        self.assertIn('cursor=', res.data['next'])
+
+    def test_published_posts_cached(self):
+        """Test repeated published requests are served from the cache"""
+        published_url = f'{self.posts_url}published/'
+        self.client.get(published_url)
+
+        with self.assertNumQueries(0):
+            res = self.client.get(published_url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data['results']), 3)
+
+    def test_published_posts_cache_invalidated_on_save(self):
+        """Test saving a post invalidates the cached published posts"""
+        published_url = f'{self.posts_url}published/'
+        self.client.get(published_url)
+        post = Post.objects.get(title='Post 0')
+        post.is_published = False
+        post.save()
+
+        res = self.client.get(published_url)
+
+        self.assertEqual(len(res.data['results']), 2)
+
+
+class PostSerializerFieldCacheTests(TestCase):
+    """Test serializer fields are cached per class"""
+
+    def test_fields_cached_per_class(self):
+        """Test each serializer class keeps its own field cache"""
+        PostSerializer().fields
+        PostListSerializer().fields
+
+        self.assertIn('content', PostSerializer._fields_cache)
+        self.assertNotIn('content', PostListSerializer._fields_cache)
+
+    def test_fields_copied_per_instance(self):
+        """Test instances get their own bound copies of the cached fields"""
+        first = PostSerializer()
+        second = PostSerializer()
+
+        self.assertIsNot(first.fields['title'], second.fields['title'])
+        self.assertIs(first.fields['title'].parent, first)
+        self.assertIs(second.fields['title'].parent, second)
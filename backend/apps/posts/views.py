@@ -1,6 +1,8 @@
 from rest_framework import viewsets, permissions, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from apps.pagination import CreatedAtCursorPagination
+from .cache import get_published_page, set_published_page
 from .models import Post
 from .serializers import PostSerializer, PostListSerializer
 
@@ -16,20 +18,40 @@ class PostViewSet(viewsets.ModelViewSet):
     partial_update: Partially update a post
     destroy: Delete a post
     """
+    pagination_class = CreatedAtCursorPagination
     queryset = Post.objects.all()
     serializer_class = PostSerializer
+    serializer_classes = {'list': PostListSerializer}
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['title', 'content']
     ordering_fields = ['created_at', 'updated_at', 'title']
+    ordering = ['-created_at']
+
+    def get_queryset(self):
+        """
+        Join the author in the same query to avoid an extra lookup per post,
+        loading only the author's name rather than the whole user row.
+        The list action only loads the columns PostListSerializer renders,
+        plus the ordering fields the pagination cursor reads.
+        """
+        queryset = Post.objects.select_related('author')
+        # author_username renders the author's full name, never the email
+        if self.action == 'list':
+            return queryset.only(
+                'id', 'title', 'created_at', 'updated_at', 'is_published',
+                'author__first_name', 'author__last_name'
+            )
+        return queryset.only(
+            'id', 'title', 'content', 'created_at', 'updated_at', 'is_published',
+            'author__first_name', 'author__last_name'
+        )
 
     def get_serializer_class(self):
         """
         Use different serializer for list action.
         """
-        if self.action == 'list':
-            return PostListSerializer
-        return PostSerializer
+        return self.serializer_classes.get(self.action, self.serializer_class)
 
     def get_permissions(self):
         """
@@ -39,31 +61,36 @@ class PostViewSet(viewsets.ModelViewSet):
             return [permissions.IsAuthenticated(), IsAuthorOrReadOnly()]
         return super().get_permissions()
 
-    def perform_create(self, serializer):
-        """
-        Set the author to the current user when creating a post.
-        """
-        serializer.save(author=self.request.user)
-
     @action(detail=False, methods=['get'])
     def my_posts(self, request):
         """
         Get posts created by the current user.
         Endpoint: /api/posts/my_posts/
         """
-        posts = self.queryset.filter(author=request.user)
-        serializer = self.get_serializer(posts, many=True)
-        return Response(serializer.data)
+        posts = self.get_queryset().filter(author=request.user)
+        page = self.paginate_queryset(posts)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
 
     @action(detail=False, methods=['get'])
     def published(self, request):
         """
         Get only published posts.
         Endpoint: /api/posts/published/
+
+        Pages are cached per URL until a post is saved or deleted.
         """
-        posts = self.queryset.filter(is_published=True)
-        serializer = self.get_serializer(posts, many=True)
-        return Response(serializer.data)
+        url = request.build_absolute_uri()
+        version, data = get_published_page(url)
+        if data is not None:
+            return Response(data)
+
+        posts = self.get_queryset().filter(is_published=True)
+        page = self.paginate_queryset(posts)
+        serializer = self.get_serializer(page, many=True)
+        response = self.get_paginated_response(serializer.data)
+        set_published_page(url, version, response.data)
+        return response
 
 
 class IsAuthorOrReadOnly(permissions.BasePermission):
@@ -1,7 +1,31 @@
+from decimal import Decimal
+
 from django.db import models
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db.models.functions import Upper
 from django.core.exceptions import ValidationError  # Make sure to import this
 
+ONE = Decimal('1')
+
+
+class ProductQuerySet(models.QuerySet):
+    """
+    Custom queryset for Product.
+    """
+    def with_total_price(self):
+        """
+        Annotate each product with its total price including tax, computed
+        by the database instead of calling calculate_total_price per row.
+        """
+        return self.annotate(
+            total_price=models.ExpressionWrapper(
+                models.F('price') * (models.Value(ONE) + models.F('tax')),
+                output_field=models.DecimalField(max_digits=16, decimal_places=4)
+            )
+        )
+
+
 class Product(models.Model):
     """
     Product model with CRUD operations.
@@ -21,12 +45,28 @@ class Product(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProductQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_by', '-created_at'], name='product_created_by_idx'),
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='product_name_trgm_idx'),
+            GinIndex(OpClass(Upper('description'), name='gin_trgm_ops'), name='product_desc_trgm_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(check=models.Q(price__gt=0), name='product_price_positive'),
+            models.CheckConstraint(check=models.Q(cost__gt=0), name='product_cost_positive'),
+            models.CheckConstraint(check=models.Q(stock__gte=0), name='product_stock_non_negative'),
+            models.CheckConstraint(check=models.Q(tax__gte=0, tax__lte=1), name='product_tax_range'),
+            models.CheckConstraint(check=models.Q(price__gte=models.F('cost')), name='product_price_gte_cost'),
+        ]
+
     def calculate_total_price(self):
         """
         Calculate total price including tax.
         Example: tax = 0.06 means 6% tax.
         """
-        return self.price * (1 + self.tax)
+        return self.price * (ONE + self.tax)
 
     def clean(self):
         """
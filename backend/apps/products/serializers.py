@@ -1,8 +1,10 @@
 from rest_framework import serializers
+from apps.mixins import CachedFieldsMixin
 from .models import Product
 
-class ProductSerializer(serializers.ModelSerializer):
+class ProductSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """Serializer for the Product model"""
+    calculate_total_price = serializers.SerializerMethodField()
 
     class Meta:
         model = Product
@@ -44,37 +46,54 @@ class ProductSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Tax cannot exceed 1.00 (100%).")
         return value
 
-    def validate_status(self, value):
-        """Ensure the status is a boolean value"""
-        if not isinstance(value, bool):
-            raise serializers.ValidationError("Status must be a boolean value.")
-        return value
+    def get_calculate_total_price(self, obj):
+        """Use the total_price annotation when the queryset provides one"""
+        total_price = getattr(obj, 'total_price', None)
+        if total_price is None:
+            return obj.calculate_total_price()
+        return total_price
 
-    def validate(self, data):
+    def check_margin(self, cost, price):
         """
-        Object-level validation to ensure cost is less than or equal to price.
+        Ensure cost is less than or equal to price.
         (You typically want to sell products for more than they cost you)
-
-        This handles both create and update (including partial update) operations.
         """
-        # Get values from data or fall back to existing instance values for updates
-        if self.instance:  # This is an update
-            cost = data.get('cost', self.instance.cost)
-            price = data.get('price', self.instance.price)
-        else:  # This is a create
-            cost = data.get('cost')
-            price = data.get('price')
-
-        # Both fields must be present for comparison
-        if cost is not None and price is not None:
-            if cost > price:
-                raise serializers.ValidationError(
-                    "Cost cannot be higher than price. You would be selling at a loss!"
-                )
-
-        return data
+        if cost > price:
+            raise serializers.ValidationError(
+                "Cost cannot be higher than price. You would be selling at a loss!"
+            )
 
     def create(self, validated_data):
         """Create and return a new Product instance"""
         validated_data['created_by'] = self.context['request'].user
         return super().create(validated_data)
+
+
+class ProductCreateSerializer(ProductSerializer):
+    """Serializer for creating products"""
+
+    def validate(self, data):
+        """Both cost and price are required fields on create"""
+        self.check_margin(data['cost'], data['price'])
+        return data
+
+
+class ProductUpdateSerializer(ProductSerializer):
+    """Serializer for updating (including partially updating) products"""
+
+    def validate(self, data):
+        """Fall back to the stored cost and price for fields left out of the update"""
+        self.check_margin(
+            data.get('cost', self.instance.cost),
+            data.get('price', self.instance.price)
+        )
+        return data
+
+
+class ProductListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """Lightweight serializer for listing products"""
+
+    class Meta:
+        model = Product
+        fields = ['id', 'name', 'price', 'status', 'created_at']
+        read_only_fields = ['id', 'created_at']
@@ -1,3 +1,185 @@
+"""
+Tests for Product endpoints.
+"""
+from decimal import Decimal
+
+from django.db import IntegrityError
 from django.test import TestCase
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+from rest_framework import status
+
+from .models import Product
+
+User = get_user_model()
+
+
+class ProductModelTests(TestCase):
+    """Test the Product model"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='TestPass123!',
+            first_name='Test',
+            last_name='User'
+        )
+
+    def test_price_below_cost_rejected_by_database(self):
+        """Test the database rejects a product priced below its cost"""
+        with self.assertRaises(IntegrityError):
+            Product.objects.create(
+                name='Loss leader',
+                price=Decimal('5.00'),
+                cost=Decimal('10.00'),
+                created_by=self.user
+            )
+
+
+class ProductPaginationTests(TestCase):
+    """Test paginating the product list"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.products_url = '/api/products/'
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='TestPass123!',
+            first_name='Test',
+            last_name='User'
+        )
+        self.client.force_authenticate(user=self.user)
+        for i in range(3):
+            Product.objects.create(
+                name=f'Product {i}',
+                price=Decimal('10.00'),
+                cost=Decimal('5.00'),
+                created_by=self.user
+            )
+
+    def test_list_products_cursor_pagination(self):
+        """Test following the cursor returns every product exactly once"""
+        res = self.client.get(self.products_url, {'pagesize': 2})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotIn('count', res.data)
+        self.assertIn('cursor=', res.data['next'])
+        names = [product['name'] for product in res.data['results']]
+
+        res = self.client.get(res.data['next'])
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIsNone(res.data['next'])
+        names += [product['name'] for product in res.data['results']]
+        self.assertEqual(names, ['Product 2', 'Product 1', 'Product 0'])
+
+    def test_list_products_lightweight(self):
+        """Test the product list renders only the summary fields"""
+        with self.assertNumQueries(1) as ctx:
+            res = self.client.get(self.products_url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            set(res.data['results'][0]),
+            {'id', 'name', 'price', 'status', 'created_at'}
+        )
+        self.assertNotIn('"description"', ctx.captured_queries[-1]['sql'])
+
+    def test_list_products_ordered_by_updated_at(self):
+        """Test ordering by a field missing from the list payload adds no queries"""
+        with self.assertNumQueries(1):
+            res = self.client.get(self.products_url, {'ordering': 'updated_at', 'pagesize': 2})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertIn('cursor=', res.data['next'])
+
+    def test_search_products_by_name(self):
+        """Test searching products matches a substring of the name"""
+        res = self.client.get(self.products_url, {'search': 'uct 1'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual([product['name'] for product in res.data['results']], ['Product 1'])
+
+    def test_low_cost_products_query_count(self):
+        """Test low_cost does not look up the creator once per product"""
+        with self.assertNumQueries(1):
+            res = self.client.get(f'{self.products_url}low_cost/', {'cost': '20'})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(res.data), 3)
+
+    def test_low_cost_products_invalid_cost(self):
+        """Test low_cost rejects a cost that is not a finite number"""
+        for cost in ['cheap', 'NaN', 'Infinity', '-Infinity', 'sNaN']:
+            with self.subTest(cost=cost):
+                res = self.client.get(f'{self.products_url}low_cost/', {'cost': cost})
+
+                self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_product_invalid_status(self):
+        """Test creating a product with a non-boolean status fails"""
+        payload = {
+            'name': 'Product',
+            'price': '10.00',
+            'cost': '5.00',
+            'tax': '0.06',
+            'status': 'notabool',
+        }
+
+        res = self.client.post(self.products_url, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('status', res.data)
+
+    def test_create_product_cost_above_price(self):
+        """Test creating a product that costs more than its price fails"""
+        payload = {'name': 'Product', 'price': '5.00', 'cost': '10.00', 'tax': '0.06'}
+
+        res = self.client.post(self.products_url, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_partial_update_cost_above_stored_price(self):
+        """Test a partial update is checked against the stored price"""
+        product = Product.objects.get(name='Product 0')
+
+        res = self.client.patch(f'{self.products_url}{product.id}/', {'cost': '20.00'}, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_product_sets_creator(self):
+        """Test creating a product assigns the current user as creator"""
+        payload = {'name': 'New product', 'price': '10.00', 'cost': '5.00', 'tax': '0.06'}
+
+        res = self.client.post(self.products_url, payload, format='json')
+
+        self.assertEqual(res.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Product.objects.get(name='New product').created_by, self.user)
+
+    def test_retrieve_product_total_price(self):
+        """Test the total price is computed by the database on retrieve"""
+        product = Product.objects.create(
+            name='Taxed',
+            price=Decimal('10.00'),
+            cost=Decimal('5.00'),
+            tax=Decimal('0.06'),
+            created_by=self.user
+        )
+
+        res = self.client.get(f'{self.products_url}{product.id}/')
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['calculate_total_price'], Decimal('10.6000'))
+        body = res.json()
+        self.assertEqual(body['calculate_total_price'], 10.6)
+        self.assertEqual(body['price'], '10.00')
+        self.assertTrue(body['created_at'].endswith('Z'))
+
+    def test_update_product_total_price_reflects_new_price(self):
+        """Test the total price in an update response uses the new price"""
+        product = Product.objects.get(name='Product 0')
+
+        res = self.client.patch(f'{self.products_url}{product.id}/', {'price': '12.00'}, format='json')
 
-# Create your tests here.
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['calculate_total_price'], Decimal('12.00'))
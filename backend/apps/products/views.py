@@ -1,9 +1,17 @@
+from decimal import Decimal, InvalidOperation
+
 from rest_framework import viewsets, permissions, filters
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from apps.pagination import CreatedAtCursorPagination
 from .models import Product
-from .serializers import ProductSerializer
-from rest_framework.pagination import PageNumberPagination
+from .serializers import (
+    ProductSerializer,
+    ProductListSerializer,
+    ProductCreateSerializer,
+    ProductUpdateSerializer,
+)
 
 
 class IsAuthorOrReadOnly(permissions.BasePermission):
@@ -17,22 +25,25 @@ class IsAuthorOrReadOnly(permissions.BasePermission):
         return obj.created_by == request.user
 
 
-class ProductPagination(PageNumberPagination):
-    page_size = 10
-    page_size_query_param = 'pagesize'
-    max_page_size = 100
-
 class ProductViewSet(viewsets.ModelViewSet):
     """
     ViewSet for Product model providing full CRUD operations.
     """
-    pagination_class = ProductPagination
+    pagination_class = CreatedAtCursorPagination
     queryset = Product.objects.all()
     serializer_class = ProductSerializer
+    serializer_classes = {
+        'list': ProductListSerializer,
+        'create': ProductCreateSerializer,
+        'update': ProductUpdateSerializer,
+        'partial_update': ProductUpdateSerializer,
+        'update_cost': ProductUpdateSerializer,
+    }
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['name', 'description']
     ordering_fields = ['created_at', 'updated_at', 'name']
+    ordering = ['-created_at']
 
 
     def get_queryset(self):
@@ -45,24 +56,22 @@ class ProductViewSet(viewsets.ModelViewSet):
         if not user.is_authenticated:
             return Product.objects.none()
         
-        # Start with user's products only
+        # Start with user's products only; ?search= is handled by SearchFilter
         queryset = Product.objects.filter(created_by=user)
-        
-        # Apply search filter if provided
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(name__icontains=search)
-        
+        if self.action == 'list':
+            # updated_at is an ordering field, so the cursor needs it loaded
+            queryset = queryset.only('id', 'name', 'price', 'status', 'created_at', 'updated_at')
+        elif self.action == 'retrieve':
+            # Writes skip the annotation so responses never show a stale total
+            queryset = queryset.with_total_price()
         return queryset
 
-    def create(self, request, *args, **kwargs):
+    def get_serializer_class(self):
         """
-        Override create to set the created_by field to the current user.
+        Use the lightweight serializer for listing and the create/update
+        serializers for writes.
         """
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        serializer.save(created_by=request.user)
-        return Response(serializer.data, status=201)
+        return self.serializer_classes.get(self.action, self.serializer_class)
 
     def update(self, request, *args, **kwargs):
         """
@@ -80,8 +89,14 @@ class ProductViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'], permission_classes=[permissions.IsAuthenticated])
     def low_cost(self, request):
         """Get products with low cost"""
-        cost = request.query_params.get('cost', 100)
-        products = self.queryset.filter(cost__lt=cost)
+        try:
+            cost = Decimal(request.query_params.get('cost', '100'))
+        except InvalidOperation:
+            cost = None
+        # Decimal also parses NaN and Infinity, which the ORM cannot compare against
+        if cost is None or not cost.is_finite():
+            raise ValidationError({'cost': 'A valid number is required.'})
+        products = self.queryset.with_total_price().filter(cost__lt=cost)
         serializer = self.get_serializer(products, many=True)
         return Response(serializer.data)
 
@@ -0,0 +1,66 @@
+"""
+Tests for shared renderers.
+"""
+import datetime
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from .renderers import ORJSONRenderer
+
+
+class ORJSONRendererTests(SimpleTestCase):
+    """Test ORJSONRenderer output against JSONRenderer"""
+
+    def assertRendersLikeJSONRenderer(self, data, renderer_context=None):
+        self.assertEqual(
+            ORJSONRenderer().render(data, renderer_context=renderer_context),
+            JSONRenderer().render(data, renderer_context=renderer_context)
+        )
+
+    def test_render_drf_types(self):
+        """Test Decimal, datetime and lazy string values render like JSONRenderer"""
+        self.assertRendersLikeJSONRenderer({
+            'price': Decimal('10.60'),
+            'created_at': datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc),
+            'message': gettext_lazy('Login successful.'),
+        })
+
+    def test_render_wide_integer(self):
+        """Test integers orjson cannot encode fall back to JSONRenderer"""
+        self.assertRendersLikeJSONRenderer({'id': 2 ** 70})
+
+    def test_render_line_separators_escaped(self):
+        """Test U+2028 and U+2029 are escaped like JSONRenderer"""
+        self.assertRendersLikeJSONRenderer({'text': 'a\u2028b\u2029c'})
+
+    def test_render_indent(self):
+        """Test indented output is rendered by JSONRenderer"""
+        self.assertRendersLikeJSONRenderer({'a': [1, 2]}, renderer_context={'indent': 2})
+
+    def test_render_ensure_ascii(self):
+        """Test ASCII-only output is rendered by JSONRenderer"""
+        class ASCIIRenderer(ORJSONRenderer):
+            ensure_ascii = True
+
+        class ASCIIJSONRenderer(JSONRenderer):
+            ensure_ascii = True
+
+        data = {'name': 'caf\u00e9'}
+
+        self.assertEqual(ASCIIRenderer().render(data), ASCIIJSONRenderer().render(data))
+        self.assertEqual(ASCIIRenderer().render(data), b'{"name":"caf\\u00e9"}')
+
+    def test_render_nan_as_null(self):
+        """Test non-finite floats render as null where strict JSONRenderer raises"""
+        data = {'a': float('nan'), 'b': float('inf')}
+
+        self.assertEqual(ORJSONRenderer().render(data), b'{"a":null,"b":null}')
+        with self.assertRaises(ValueError):
+            JSONRenderer().render(data)
+
+    def test_render_none(self):
+        """Test None renders as an empty body"""
+        self.assertEqual(ORJSONRenderer().render(None), b'')
